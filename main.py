@@ -9,8 +9,8 @@ from trading_bot.config.config import (
 )
 from trading_bot.data_fetcher.fetch_ohlcv import fetch_ohlcv
 from trading_bot.data_fetcher.fetch_orderbook import fetch_orderbook
-from trading_bot.data_fetcher.fetch_realtime import start_websocket
-from trading_bot.database.mongodb_setup import save_ohlcv, save_orderbook
+from trading_bot.data_fetcher.fetch_realtime import start_websocket, init_indicators
+from trading_bot.database.mongodb_setup import get_database, ensure_indexes, save_ohlcv, save_orderbook
 from trading_bot.utils.logger import setup_logger
 
 # Importing analysis modules
@@ -41,6 +41,13 @@ def generate_signal(bullish_score, bearish_score, news_sentiment):
 def main():
     logger.info("🚀 Starting Bybit trading bot...")
 
+    # --- Prepare Storage ---
+    # Indexes back the range queries in mongodb_query; creating them is a no-op once they exist
+    db, client = get_database()
+    if db is not None:
+        ensure_indexes(db)
+        client.close()
+
     # --- Fetch & Store Market Data ---
     # Fetch OHLCV Data (using interval "1" for 1 minute candles)
     try:
@@ -104,6 +111,7 @@ def main():
     # --- Start WebSocket for Real-Time Data ---
     try:
         logger.info("📡 Starting WebSocket for real-time data...")
+        init_indicators("BTCUSDT", "1", ohlcv_data)
         ws_thread = threading.Thread(target=start_websocket, daemon=True)
         ws_thread.start()
     except Exception as e:
@@ -0,0 +1,83 @@
+"""
+Client-side decode cost of fetch_candles versus plain find() iteration.
+
+Encodes the BSON reply batches each approach receives from the server and
+times decoding them into a DataFrame. Server-side query time is not
+included; run against a live database for end-to-end numbers.
+
+Usage: python -m tests.bench_mongodb_query [n_candles]
+"""
+import sys
+import time
+
+import bson
+import numpy as np
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+import pandas as pd
+
+import tests.conftest  # noqa: F401  (config stand-in)
+from trading_bot.database.mongodb_query import CANDLE_CHUNK_BATCH_SIZE, CANDLE_CHUNK_MS, _chunks_to_columns
+
+# Candles per batch for the plain find() baseline (~1.2 MB of full documents)
+FIND_BATCH_SIZE = 10000
+from trading_bot.database.mongodb_setup import OHLCV_FIELDS
+
+
+def _encode_batches(docs, batch_size):
+    return [b"".join(bson.encode(doc) for doc in docs[i:i + batch_size]) for i in range(0, len(docs), batch_size)]
+
+
+def _time(label, func, repeat=3):
+    best = min(_timed(func) for _ in range(repeat))
+    print(f"{label:32s} {best:8.3f} s")
+    return best
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(n):
+    rng = np.random.default_rng(0)
+    ts = 1735689600000 + np.arange(n, dtype=np.int64) * 60000
+    close = 60000 + np.cumsum(rng.normal(0, 30, n))
+    data = {"timestamp": ts, "open": close, "high": close + 10, "low": close - 10, "close": close,
+            "volume": rng.uniform(0, 100, n)}
+
+    full_docs = [
+        {"_id": bson.ObjectId(), "symbol": "BTCUSDT", "interval": "1", "timestamp": int(ts[i]),
+         "open": float(close[i]), "high": float(close[i] + 10), "low": float(close[i] - 10),
+         "close": float(close[i]), "volume": float(data["volume"][i])}
+        for i in range(n)
+    ]
+    chunk_ids = ts - ts % CANDLE_CHUNK_MS
+    boundaries = np.flatnonzero(np.diff(chunk_ids)) + 1
+    chunk_docs = [
+        {"_id": int(chunk_ids[idx[0]]), **{f: data[f][idx].tolist() for f in OHLCV_FIELDS}}
+        for idx in np.split(np.arange(n), boundaries)
+    ]
+
+    find_batches = _encode_batches(full_docs, FIND_BATCH_SIZE)
+    chunk_batches = _encode_batches(chunk_docs, CANDLE_CHUNK_BATCH_SIZE)
+    del full_docs, chunk_docs
+
+    def naive():
+        docs = [doc for batch in find_batches for doc in bson.decode_all(batch)]
+        return pd.DataFrame(docs)
+
+    def chunked():
+        raw = CodecOptions(document_class=RawBSONDocument)
+        chunks = [doc for batch in chunk_batches for doc in bson.decode_all(batch, raw)]
+        return pd.DataFrame(_chunks_to_columns(chunks))
+
+    print(f"{n} candles, {len(chunk_batches[0]) // 1024} KB chunk batch")
+    baseline = _time("find() + DataFrame(docs)", naive)
+    result = _time("chunked columns", chunked)
+    print(f"ratio: {result / baseline:.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
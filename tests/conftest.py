@@ -0,0 +1,14 @@
+import sys
+import types
+
+# trading_bot.config.config loads API keys from .env at import time and raises
+# without them; the unit tests only need the module-level settings to exist.
+_config = types.ModuleType("trading_bot.config.config")
+_config.BYBIT_API_KEY = "test"
+_config.BYBIT_SECRET_KEY = "test"
+_config.MONGO_URI = "mongodb://localhost:27017"
+_config.DB_NAME = "trading_bot_test"
+_config.USE_TESTNET = True
+_config.BYBIT_BASE_URL = "https://api-testnet.bybit.com"
+_config.INDICATOR_STATE_PATH = "indicator_state.json"
+sys.modules.setdefault("trading_bot.config.config", _config)
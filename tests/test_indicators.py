@@ -0,0 +1,180 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+import talib
+
+from trading_bot.analysis.indicators import (
+    ATR, EMA, Indicator, IndicatorBank, atr, bbands, compute_indicators, ema, load_indicator_state, macd, rsi,
+    save_indicator_state, volatility
+)
+
+N = 600
+
+
+@pytest.fixture
+def candles():
+    rng = np.random.default_rng(7)
+    close = 60000 + np.cumsum(rng.normal(0, 30, N))
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-01", periods=N, freq="min"),
+        "open": close + rng.normal(0, 5, N),
+        "high": close + rng.uniform(0, 40, N),
+        "low": close - rng.uniform(0, 40, N),
+        "close": close
+    })
+
+
+def _starts(df):
+    return ((df["timestamp"] - pd.Timestamp(0)) // pd.Timedelta(milliseconds=1)).tolist()
+
+
+def _assert_matches(actual, expected):
+    actual, expected = np.asarray(actual, dtype=float), np.asarray(expected, dtype=float)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, equal_nan=True)
+
+
+def test_batch_matches_talib(candles):
+    high, low, close = candles["high"], candles["low"], candles["close"]
+
+    np.testing.assert_array_equal(ema(close, 20), talib.EMA(close.to_numpy(), 20))
+    np.testing.assert_array_equal(rsi(close, 14), talib.RSI(close.to_numpy(), 14))
+    np.testing.assert_array_equal(
+        atr(high, low, close, 14), talib.ATR(high.to_numpy(), low.to_numpy(), close.to_numpy(), 14)
+    )
+    for ours, theirs in zip(bbands(close, 20), talib.BBANDS(close.to_numpy(), 20, 2, 2)):
+        np.testing.assert_array_equal(ours, theirs)
+    for ours, theirs in zip(macd(close), talib.MACD(close.to_numpy())):
+        np.testing.assert_array_equal(ours, theirs)
+
+
+def test_volatility_matches_rolling_std(candles):
+    expected = np.log(candles["close"]).diff().rolling(20).std()
+    _assert_matches(volatility(candles["close"], 20), expected)
+
+
+def test_compute_indicators_sorts_by_timestamp(candles):
+    # Bybit returns candles newest first
+    reversed_df = candles.iloc[::-1]
+    indicators = compute_indicators(reversed_df)
+
+    assert indicators["rsi_14"].index.equals(candles.index)
+    _assert_matches(indicators["rsi_14"].sort_index(), talib.RSI(candles["close"].to_numpy(), 14))
+
+
+def test_compute_indicators_missing_columns():
+    assert compute_indicators(pd.DataFrame({"close": [1.0, 2.0]})) == {}
+
+
+def test_streaming_matches_batch(candles):
+    batch = compute_indicators(candles)
+    bank = IndicatorBank()
+    streamed = []
+
+    rows = zip(_starts(candles), candles["high"], candles["low"], candles["close"])
+    for i, (start, high, low, close) in enumerate(rows):
+        # In-progress ticks must not change committed state
+        bank.update("BTCUSDT", "1", start, high + 25, low - 25, close + 10, final=False)
+        bank.update("BTCUSDT", "1", start, high, low, close - 3, final=False)
+        streamed.append(bank.update("BTCUSDT", "1", start, high, low, close, final=True))
+        assert bank.update("BTCUSDT", "1", start, high, low, close, final=True) is None
+
+        if i == N // 2:
+            bank = IndicatorBank.from_state(json.loads(json.dumps(bank.state())))
+
+    for name in ("ema_20", "ema_50", "rsi_14", "atr_14", "volatility_20"):
+        _assert_matches([values[name] for values in streamed], batch[name])
+    for i, name in enumerate(("bb_upper", "bb_middle", "bb_lower")):
+        _assert_matches([values["bbands_20"][i] for values in streamed], batch[name])
+    for i, name in enumerate(("macd", "macd_signal", "macd_hist")):
+        _assert_matches([values["macd"][i] for values in streamed], batch[name])
+
+
+def test_missed_confirm_commits_pending_candle():
+    bank = IndicatorBank({"ema_3": (EMA, {"period": 3})})
+    closes = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    for i, close in enumerate(closes):
+        # The candle at index 3 is never seen closed
+        bank.update("BTCUSDT", "1", i * 60000, close, close, close, final=(i != 3))
+
+    assert bank.latest("BTCUSDT", "1")["ema_3"] == pytest.approx(talib.EMA(np.array(closes), 3)[-1])
+
+
+def test_update_from_kline():
+    bank = IndicatorBank({"atr_2": (ATR, {"period": 2})})
+    message = {
+        "topic": "kline.5.ETHUSDT",
+        "data": [
+            {"start": 0, "high": "10", "low": "8", "close": "9", "confirm": True},
+            {"start": 300000, "high": "11", "low": "9", "close": "10", "confirm": True},
+            {"start": 600000, "high": "12", "low": "9", "close": "11", "confirm": False}
+        ]
+    }
+    values = bank.update_from_kline(message)
+
+    assert values["atr_2"] == pytest.approx((2.0 + 3.0) / 2)
+    assert bank.latest("ETHUSDT", "5") == values
+    assert bank.latest("BTCUSDT", "1") == {}
+
+
+def test_warm_up_resumes_from_saved_state(candles, tmp_path):
+    closed = candles.iloc[:-1]
+    head, tail = closed.iloc[:400], closed.iloc[300:]
+
+    bank = IndicatorBank()
+    bank.warm_up(head)
+    path = tmp_path / "state.json"
+    save_indicator_state(bank, path)
+
+    restored = load_indicator_state(path)
+    assert restored.latest("BTCUSDT", "1") == bank.latest("BTCUSDT", "1")
+    restored.warm_up(tail)
+
+    full = IndicatorBank()
+    full.warm_up(closed)
+    assert restored.latest("BTCUSDT", "1") == full.latest("BTCUSDT", "1")
+
+
+def test_warm_up_rebuilds_when_state_is_too_old(candles):
+    bank = IndicatorBank()
+    bank.warm_up(candles.iloc[:100])
+    bank.warm_up(candles.iloc[200:])
+
+    fresh = IndicatorBank()
+    fresh.warm_up(candles.iloc[200:])
+    assert bank.latest("BTCUSDT", "1") == fresh.latest("BTCUSDT", "1")
+
+
+def test_warm_up_contiguous_batches_match_full_history(candles):
+    bank = IndicatorBank()
+    bank.warm_up(candles.iloc[:100])
+    bank.warm_up(candles.iloc[100:])
+
+    full = IndicatorBank()
+    full.warm_up(candles)
+    assert bank.state() == full.state()
+
+
+def test_update_skips_invalid_prices_without_partial_commit(candles):
+    bank = IndicatorBank()
+    bank.warm_up(candles.iloc[:100])
+    before = bank.state()
+
+    start = _starts(candles)[100]
+    for close in (0.0, -1.0, float("nan"), float("inf")):
+        assert bank.update("BTCUSDT", "1", start, 60000.0, 59000.0, close) is None
+    assert bank.state() == before
+
+
+def test_indicator_requires_update():
+    class Incomplete(Indicator):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_load_indicator_state_missing_file(tmp_path):
+    assert load_indicator_state(tmp_path / "missing.json") is None
@@ -0,0 +1,177 @@
+from datetime import datetime, timezone
+
+import bson
+import numpy as np
+import pandas as pd
+from bson.raw_bson import RawBSONDocument
+
+from trading_bot.database.mongodb_query import (
+    CANDLE_CHUNK_MS, _candle_pipeline, _chunks_to_columns, _pack_levels, _range_filter, _to_ms
+)
+from trading_bot.database.mongodb_setup import OHLCV_FIELDS
+
+START_MS = 1735689600000  # 2025-01-01 00:00:00 UTC
+END_MS = START_MS + 3600000
+
+
+def test_to_ms_accepts_numbers_as_milliseconds():
+    assert _to_ms(None) is None
+    assert _to_ms(START_MS) == START_MS
+    assert _to_ms(np.int64(START_MS)) == START_MS
+    assert _to_ms(float(START_MS) + 0.7) == START_MS
+    assert _to_ms(np.float64(START_MS)) == START_MS
+
+
+def test_to_ms_accepts_datetimes():
+    assert _to_ms(datetime(2025, 1, 1, tzinfo=timezone.utc)) == START_MS
+    assert _to_ms(pd.Timestamp("2025-01-01")) == START_MS
+    assert _to_ms("2025-01-01T01:00:00Z") == END_MS
+
+
+def test_range_filter():
+    assert _range_filter(None, None) is None
+    assert _range_filter(START_MS, None) == {"$gte": START_MS}
+    assert _range_filter(None, END_MS) == {"$lt": END_MS}
+    assert _range_filter(START_MS, END_MS, as_datetime=True) == {
+        "$gte": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "$lt": datetime(2025, 1, 1, 1, tzinfo=timezone.utc)
+    }
+
+
+def _chunk_stage(pipeline):
+    group = pipeline[-2]["$group"]
+    assert pipeline[-1] == {"$sort": {"_id": 1}}
+    assert group["_id"] == {"$subtract": ["$timestamp", {"$mod": ["$timestamp", CANDLE_CHUNK_MS]}]}
+    assert {field: group[field] for field in OHLCV_FIELDS} == {f: {"$push": f"${f}"} for f in OHLCV_FIELDS}
+    return group
+
+
+def test_candle_pipeline_regular_collection():
+    pipeline = _candle_pipeline("BTCUSDT", "1", START_MS, END_MS, None, timeseries=False)
+
+    assert pipeline[0] == {"$match": {
+        "symbol": "BTCUSDT", "interval": "1", "timestamp": {"$gte": START_MS, "$lt": END_MS}
+    }}
+    assert pipeline[1] == {"$sort": {"timestamp": 1}}
+    assert len(pipeline) == 4
+    _chunk_stage(pipeline)
+
+
+def test_candle_pipeline_timeseries_collection():
+    pipeline = _candle_pipeline("BTCUSDT", "1", START_MS, None, None, timeseries=True)
+
+    assert pipeline[0] == {"$match": {
+        "meta.symbol": "BTCUSDT", "meta.interval": "1",
+        "time": {"$gte": datetime(2025, 1, 1, tzinfo=timezone.utc)}
+    }}
+    assert pipeline[1] == {"$sort": {"time": 1}}
+    _chunk_stage(pipeline)
+
+
+def test_candle_pipeline_without_range():
+    pipeline = _candle_pipeline("ETHUSDT", "5", None, None, None, timeseries=False)
+    assert pipeline[0] == {"$match": {"symbol": "ETHUSDT", "interval": "5"}}
+
+
+def test_candle_pipeline_downsample():
+    for timeseries in (False, True):
+        pipeline = _candle_pipeline("BTCUSDT", "1", START_MS, END_MS, 15, timeseries)
+
+        bucket = pipeline[2]["$group"]
+        assert bucket["_id"] == {"$subtract": ["$timestamp", {"$mod": ["$timestamp", 15 * 60 * 1000]}]}
+        assert bucket["open"] == {"$first": "$open"}
+        assert bucket["high"] == {"$max": "$high"}
+        assert bucket["low"] == {"$min": "$low"}
+        assert bucket["close"] == {"$last": "$close"}
+        assert bucket["volume"] == {"$sum": "$volume"}
+        assert pipeline[3] == {"$sort": {"_id": 1}}
+        assert pipeline[4]["$project"]["timestamp"] == "$_id"
+        _chunk_stage(pipeline)
+
+
+def test_chunks_to_columns_concatenates_in_order():
+    chunks = [
+        {"_id": 0, "timestamp": [1, 2], "open": [1.0, 2.0], "high": [1.5, 2.5],
+         "low": [0.5, 1.5], "close": [1.2, 2.2], "volume": [10.0, 20.0]},
+        {"_id": CANDLE_CHUNK_MS, "timestamp": [3], "open": [3.0], "high": [3.5],
+         "low": [2.5], "close": [3.2], "volume": [30.0]}
+    ]
+    columns = _chunks_to_columns(chunks)
+
+    assert columns["timestamp"].dtype == np.int64
+    np.testing.assert_array_equal(columns["timestamp"], [1, 2, 3])
+    np.testing.assert_array_equal(columns["close"], [1.2, 2.2, 3.2])
+    assert columns["volume"].dtype == np.float64
+
+
+def _raw_chunk(n, offset=0, **overrides):
+    values = {
+        "_id": 0,
+        "timestamp": [START_MS + (offset + i) * 60000 for i in range(n)],
+        "open": [100.0 + i for i in range(n)],
+        "high": [101.5 + i for i in range(n)],
+        "low": [99.25 + i for i in range(n)],
+        "close": [100.5 + i for i in range(n)],
+        "volume": [i / 3 for i in range(n)]
+    }
+    values.update(overrides)
+    return values, RawBSONDocument(bson.encode(values))
+
+
+def test_chunks_to_columns_decodes_raw_chunks():
+    # Sizes crossing the 1-, 2- and 3-digit array key boundaries
+    expected, chunks = {f: [] for f in OHLCV_FIELDS}, []
+    offset = 0
+    for n in (1, 10, 11, 100, 1001):
+        values, raw = _raw_chunk(n, offset)
+        chunks.append(raw)
+        for field in OHLCV_FIELDS:
+            expected[field] += values[field]
+        offset += n
+
+    columns = _chunks_to_columns(chunks)
+
+    assert columns["timestamp"].dtype == np.int64
+    for field in OHLCV_FIELDS:
+        np.testing.assert_array_equal(columns[field], expected[field])
+
+
+def test_chunks_to_columns_falls_back_for_other_types():
+    # Whole-number volumes stored as int32 instead of doubles
+    values, raw = _raw_chunk(12, volume=list(range(12)))
+    columns = _chunks_to_columns([raw])
+
+    assert columns["volume"].dtype == np.float64
+    np.testing.assert_array_equal(columns["volume"], values["volume"])
+    np.testing.assert_array_equal(columns["timestamp"], values["timestamp"])
+
+
+def test_chunks_to_columns_empty():
+    columns = _chunks_to_columns([])
+    assert set(columns) == set(OHLCV_FIELDS)
+    assert all(len(values) == 0 for values in columns.values())
+    assert columns["timestamp"].dtype == np.int64
+
+
+def test_pack_levels_pads_short_books():
+    packed = _pack_levels([[[100.0, 1.0], [99.5, 2.0]], [[101.0, 3.0]], []], depth=2)
+
+    assert packed.shape == (3, 2, 2)
+    np.testing.assert_array_equal(packed[0], [[100.0, 1.0], [99.5, 2.0]])
+    np.testing.assert_array_equal(packed[1, 0], [101.0, 3.0])
+    assert np.isnan(packed[1, 1]).all()
+    assert np.isnan(packed[2]).all()
+
+
+def test_timeseries_record_keeps_series_key_in_meta_only():
+    from trading_bot.database.mongodb_setup import _to_timeseries_record
+
+    record = {"symbol": "BTCUSDT", "interval": "1", "timestamp": START_MS, "open": 1.0}
+    converted = _to_timeseries_record(record)
+
+    assert converted == {
+        "timestamp": START_MS, "open": 1.0,
+        "time": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "meta": {"symbol": "BTCUSDT", "interval": "1"}
+    }
+    assert record["symbol"] == "BTCUSDT"
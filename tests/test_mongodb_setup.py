@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from trading_bot.database import mongodb_setup
+from trading_bot.database.mongodb_setup import migrate_ohlcv_to_timeseries, save_ohlcv
+
+START_MS = 1735689600000  # 2025-01-01 00:00:00 UTC
+
+
+def _mock_db(collections, timeseries=()):
+    """
+    Returns (manager, db) where every collection is a child of `manager`, so
+    manager.mock_calls records database and collection calls in order.
+    """
+    manager = MagicMock()
+    db = manager.db
+    db.__getitem__.side_effect = lambda name: getattr(manager, name)
+
+    def list_collection_names(filter=None):
+        if filter:
+            return [name for name in timeseries if name == filter["name"]]
+        return list(collections)
+
+    db.list_collection_names.side_effect = list_collection_names
+    return manager, db
+
+
+def _candle_docs(n):
+    return [
+        {"symbol": "BTCUSDT", "interval": "1", "timestamp": START_MS + i * 60000,
+         "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.0}
+        for i in range(n)
+    ]
+
+
+def _calls(manager, names):
+    return [(name, args) for name, args, _ in manager.mock_calls if name in names]
+
+
+MIGRATION_CALLS = {"ohlcv.rename", "ohlcv_legacy.rename", "db.create_collection",
+                   "db.drop_collection", "ohlcv.insert_many"}
+
+
+@pytest.fixture
+def run_migration():
+    def run(manager, db, **kwargs):
+        with patch.object(mongodb_setup, "get_database", return_value=(db, manager.client)):
+            return migrate_ohlcv_to_timeseries(**kwargs)
+    return run
+
+
+def test_migration_success(run_migration):
+    manager, db = _mock_db(["ohlcv", "orderbook"])
+    manager.ohlcv_legacy.find.return_value.batch_size.return_value = iter(_candle_docs(3))
+    manager.ohlcv_legacy.count_documents.return_value = 3
+
+    assert run_migration(manager, db, batch_size=2) == 3
+
+    calls = _calls(manager, MIGRATION_CALLS)
+    assert [name for name, _ in calls] == [
+        "ohlcv.rename", "db.create_collection", "ohlcv.insert_many", "ohlcv.insert_many"
+    ]
+    assert calls[0][1] == ("ohlcv_legacy",)
+    assert calls[1][1] == ("ohlcv",)
+    records = calls[2][1][0] + calls[3][1][0]
+    assert [r["meta"] for r in records] == [{"symbol": "BTCUSDT", "interval": "1"}] * 3
+    assert "symbol" not in records[0]
+    manager.ohlcv_legacy.drop.assert_not_called()
+    manager.client.close.assert_called_once()
+
+
+def test_migration_rolls_back_on_copy_error(run_migration):
+    manager, db = _mock_db(["ohlcv"])
+    manager.ohlcv_legacy.find.return_value.batch_size.return_value = iter(_candle_docs(3))
+    manager.ohlcv.insert_many.side_effect = RuntimeError("insert failed")
+
+    assert run_migration(manager, db) is None
+
+    assert [name for name, _ in _calls(manager, MIGRATION_CALLS)] == [
+        "ohlcv.rename", "db.create_collection", "ohlcv.insert_many", "db.drop_collection", "ohlcv_legacy.rename"
+    ]
+    db.drop_collection.assert_called_once_with("ohlcv")
+    manager.ohlcv_legacy.rename.assert_called_once_with("ohlcv")
+
+
+def test_migration_rolls_back_on_count_mismatch(run_migration):
+    manager, db = _mock_db(["ohlcv"])
+    manager.ohlcv_legacy.find.return_value.batch_size.return_value = iter(_candle_docs(3))
+    manager.ohlcv_legacy.count_documents.return_value = 4
+
+    assert run_migration(manager, db, drop_source=True) is None
+
+    db.drop_collection.assert_called_once_with("ohlcv")
+    manager.ohlcv_legacy.rename.assert_called_once_with("ohlcv")
+    manager.ohlcv_legacy.drop.assert_not_called()
+
+
+def test_migration_skips_timeseries_collection(run_migration):
+    manager, db = _mock_db(["ohlcv"], timeseries=["ohlcv"])
+
+    assert run_migration(manager, db) == 0
+    assert _calls(manager, MIGRATION_CALLS) == []
+
+
+def _candles_frame(closes):
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime([START_MS + i * 60000 for i in range(len(closes))], unit="ms"),
+        "open": 1.0, "high": 2.0, "low": 0.5, "close": closes, "volume": 10.0
+    })
+
+
+def test_save_ohlcv_timeseries_replaces_stored_candles():
+    manager, db = _mock_db(["ohlcv"], timeseries=["ohlcv"])
+
+    with patch.object(mongodb_setup, "get_database", return_value=(db, manager.client)):
+        save_ohlcv(_candles_frame([1.5, 1.7]), "BTCUSDT", "1")
+
+    times = [datetime.fromtimestamp((START_MS + i * 60000) / 1000, tz=timezone.utc) for i in range(2)]
+    assert [name for name, _ in _calls(manager, {"ohlcv.delete_many", "ohlcv.insert_many"})] == [
+        "ohlcv.delete_many", "ohlcv.insert_many"
+    ]
+    manager.ohlcv.delete_many.assert_called_once_with(
+        {"meta.symbol": "BTCUSDT", "meta.interval": "1", "time": {"$in": times}}
+    )
+    records = manager.ohlcv.insert_many.call_args[0][0]
+    assert [r["close"] for r in records] == [1.5, 1.7]
+    assert [r["time"] for r in records] == times
+    manager.ohlcv.update_one.assert_not_called()
+
+
+def test_save_ohlcv_regular_collection_upserts():
+    manager, db = _mock_db(["ohlcv"])
+
+    with patch.object(mongodb_setup, "get_database", return_value=(db, manager.client)):
+        save_ohlcv(_candles_frame([1.5]), "BTCUSDT", "1")
+
+    filter_, update = manager.ohlcv.update_one.call_args[0]
+    assert filter_ == {"symbol": "BTCUSDT", "interval": "1", "timestamp": START_MS}
+    assert update["$set"]["close"] == 1.5
+    manager.ohlcv.delete_many.assert_not_called()
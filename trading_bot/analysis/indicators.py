@@ -0,0 +1,740 @@
+import os
+import abc
+import json
+import math
+import talib
+import logging
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Thresholds TA-Lib uses for TA_IS_ZERO / TA_IS_ZERO_OR_NEG
+_ZERO = 1e-8
+
+def _as_array(values):
+    return np.asarray(values, dtype=np.float64)
+
+def ema(close, period=30):
+    """
+    Exponential moving average using TA-Lib.
+
+    Args:
+        close (array-like): Close prices.
+        period (int): Smoothing period.
+
+    Returns:
+        np.ndarray: EMA values, NaN during the lookback period.
+    """
+    return talib.EMA(_as_array(close), timeperiod=period)
+
+def rsi(close, period=14):
+    """
+    Relative strength index with Wilder smoothing using TA-Lib.
+
+    Args:
+        close (array-like): Close prices.
+        period (int): Smoothing period.
+
+    Returns:
+        np.ndarray: RSI values (0-100), NaN during the lookback period.
+    """
+    return talib.RSI(_as_array(close), timeperiod=period)
+
+def atr(high, low, close, period=14):
+    """
+    Average true range with Wilder smoothing using TA-Lib.
+
+    Args:
+        high (array-like): High prices.
+        low (array-like): Low prices.
+        close (array-like): Close prices.
+        period (int): Smoothing period.
+
+    Returns:
+        np.ndarray: ATR values, NaN during the lookback period.
+    """
+    return talib.ATR(_as_array(high), _as_array(low), _as_array(close), timeperiod=period)
+
+def bbands(close, period=5, nbdevup=2.0, nbdevdn=2.0):
+    """
+    Bollinger bands over an SMA with population standard deviation using TA-Lib.
+
+    Args:
+        close (array-like): Close prices.
+        period (int): Window length.
+        nbdevup (float): Standard deviations above the middle band.
+        nbdevdn (float): Standard deviations below the middle band.
+
+    Returns:
+        tuple: (upper, middle, lower) arrays, NaN during the lookback period.
+    """
+    return talib.BBANDS(_as_array(close), timeperiod=period, nbdevup=nbdevup, nbdevdn=nbdevdn,
+                        matype=talib.MA_Type.SMA)
+
+def macd(close, fast=12, slow=26, signal=9):
+    """
+    MACD line, signal line and histogram using TA-Lib.
+
+    Args:
+        close (array-like): Close prices.
+        fast (int): Fast EMA period.
+        slow (int): Slow EMA period.
+        signal (int): Signal EMA period.
+
+    Returns:
+        tuple: (macd, signal, hist) arrays, NaN during the lookback period.
+    """
+    return talib.MACD(_as_array(close), fastperiod=fast, slowperiod=slow, signalperiod=signal)
+
+def volatility(close, period=20):
+    """
+    Rolling volatility as the sample standard deviation of log returns.
+
+    Args:
+        close (array-like): Close prices.
+        period (int): Number of returns per window.
+
+    Returns:
+        np.ndarray: Volatility per bar (not annualised), NaN during the lookback period.
+    """
+    close = _as_array(close)
+    out = np.full(len(close), np.nan)
+    valid = np.flatnonzero(~np.isnan(close))
+    begin = int(valid[0]) if len(valid) else len(close)
+    if len(close) - begin <= period:
+        return out
+
+    returns = np.diff(np.log(close[begin:]))
+    windows = sliding_window_view(returns, period)
+    total = windows.sum(axis=1)
+    var = (np.einsum("ij,ij->i", windows, windows) - total * total / period) / (period - 1)
+    out[begin + period:] = np.sqrt(np.maximum(var, 0.0))
+    return out
+
+def compute_indicators(df):
+    """
+    Computes the default indicator set over a candle DataFrame.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'high', 'low', 'close' columns, and
+            optionally 'timestamp' (rows are sorted by it first).
+
+    Returns:
+        dict: Dictionary with each indicator's Series as values.
+    """
+    required_columns = {'high', 'low', 'close'}
+    if not required_columns.issubset(df.columns):
+        logging.error(f"DataFrame is missing required columns: {required_columns - set(df.columns)}")
+        return {}
+
+    try:
+        if "timestamp" in df.columns:
+            df = df.sort_values("timestamp")
+        high, low, close = (df[col].to_numpy(dtype=np.float64) for col in ("high", "low", "close"))
+
+        upper, middle, lower = bbands(close, 20)
+        macd_line, macd_signal, macd_hist = macd(close)
+        results = {
+            "ema_20": ema(close, 20),
+            "ema_50": ema(close, 50),
+            "rsi_14": rsi(close, 14),
+            "atr_14": atr(high, low, close, 14),
+            "bb_upper": upper,
+            "bb_middle": middle,
+            "bb_lower": lower,
+            "macd": macd_line,
+            "macd_signal": macd_signal,
+            "macd_hist": macd_hist,
+            "volatility_20": volatility(close, 20)
+        }
+        return {name: pd.Series(values, index=df.index) for name, values in results.items()}
+
+    except Exception as e:
+        logging.error(f"Error computing indicators: {e}")
+        return {}
+
+def _rsi_value(gain, loss):
+    total = gain + loss
+    return 100.0 * (gain / total) if not -_ZERO < total < _ZERO else 0.0
+
+def _true_range(high, low, prev_close):
+    return max(high - low, abs(prev_close - high), abs(low - prev_close))
+
+class Indicator(abc.ABC):
+    """
+    Base class for streaming indicators with O(1) state.
+
+    `update(high, low, close, final)` returns the indicator value for one
+    candle. With final=False (an in-progress candle) the value is computed
+    without changing state, so the same candle can be re-sent on every tick
+    and is only committed once it closes.
+
+    Subclasses list their constructor arguments in `_params` and their
+    mutable state in `_state`; both must be JSON-serialisable.
+    """
+    __slots__ = ()
+    _params = ()
+    _state = ()
+
+    @abc.abstractmethod
+    def update(self, high, low, close, final=True):
+        """
+        Returns the indicator value for one candle, committing it if `final`.
+        """
+
+    def state(self):
+        """
+        Returns a JSON-serialisable snapshot that `indicator_from_state` can restore.
+        """
+        return {
+            "type": type(self).__name__,
+            "params": {name: getattr(self, name) for name in self._params},
+            "state": {name: _copy(getattr(self, name)) for name in self._state}
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        indicator = cls(**state["params"])
+        for name, value in state["state"].items():
+            setattr(indicator, name, _copy(value))
+        return indicator
+
+def _copy(value):
+    return list(value) if isinstance(value, list) else value
+
+class _RollingWindow(Indicator):
+    """
+    Ring buffer with running sum and sum of squares over the last `size` values.
+    The window length is passed to each call.
+
+    Sums are recomputed from the buffer once per full cycle to stop
+    floating-point drift from accumulating on long-running streams.
+    """
+    __slots__ = ()
+    _window_state = ("_ring", "_pos", "_sum", "_sumsq")
+
+    def _init_window(self):
+        self._ring = []
+        self._pos = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def _peek_window(self, x, size):
+        """
+        Returns (count, sum, sumsq) of the window as if `x` had been pushed.
+        """
+        total, total_sq = self._sum + x, self._sumsq + x * x
+        if len(self._ring) == size:
+            oldest = self._ring[self._pos]
+            return size, total - oldest, total_sq - oldest * oldest
+        return len(self._ring) + 1, total, total_sq
+
+    def _push_window(self, x, size, total, total_sq):
+        if len(self._ring) < size:
+            self._ring.append(x)
+            self._sum, self._sumsq = total, total_sq
+            return
+        self._ring[self._pos] = x
+        self._pos = (self._pos + 1) % size
+        if self._pos == 0:
+            self._sum = sum(self._ring)
+            self._sumsq = sum(v * v for v in self._ring)
+        else:
+            self._sum, self._sumsq = total, total_sq
+
+class EMA(Indicator):
+    """Streaming EMA, seeded with an SMA like talib.EMA."""
+    __slots__ = ("period", "_k", "_count", "_total", "_value")
+    _params = ("period",)
+    _state = ("_count", "_total", "_value")
+
+    def __init__(self, period=30):
+        self.period = period
+        self._k = 2.0 / (period + 1)
+        self._count = 0
+        self._total = 0.0
+        self._value = 0.0
+
+    def update(self, high, low, close, final=True):
+        if self._count < self.period:
+            total = self._total + close
+            value = total / self.period if self._count + 1 == self.period else math.nan
+            if final:
+                self._total = total
+                self._value = value if self._count + 1 == self.period else 0.0
+                self._count += 1
+            return value
+
+        value = ((close - self._value) * self._k) + self._value
+        if final:
+            self._value = value
+        return value
+
+class RSI(Indicator):
+    """Streaming RSI with Wilder smoothing, like talib.RSI."""
+    __slots__ = ("period", "_count", "_prev_close", "_gain", "_loss")
+    _params = ("period",)
+    _state = ("_count", "_prev_close", "_gain", "_loss")
+
+    def __init__(self, period=14):
+        self.period = period
+        self._count = 0
+        self._prev_close = 0.0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def update(self, high, low, close, final=True):
+        if self._count == 0:
+            if final:
+                self._prev_close = close
+                self._count = 1
+            return math.nan
+
+        diff = close - self._prev_close
+        gain, loss = self._gain, self._loss
+        if self._count > self.period:
+            gain *= (self.period - 1)
+            loss *= (self.period - 1)
+        if diff < 0:
+            loss -= diff
+        else:
+            gain += diff
+
+        value = math.nan
+        if self._count >= self.period:
+            gain /= self.period
+            loss /= self.period
+            value = _rsi_value(gain, loss)
+
+        if final:
+            self._prev_close = close
+            self._gain, self._loss = gain, loss
+            self._count += 1
+        return value
+
+class ATR(Indicator):
+    """Streaming ATR with Wilder smoothing, like talib.ATR."""
+    __slots__ = ("period", "_count", "_prev_close", "_total", "_value")
+    _params = ("period",)
+    _state = ("_count", "_prev_close", "_total", "_value")
+
+    def __init__(self, period=14):
+        self.period = period
+        self._count = 0
+        self._prev_close = 0.0
+        self._total = 0.0
+        self._value = 0.0
+
+    def update(self, high, low, close, final=True):
+        if self._count == 0:
+            if final:
+                self._prev_close = close
+                self._count = 1
+            return math.nan
+
+        tr = _true_range(high, low, self._prev_close)
+        total = self._total
+        if self._count < self.period:
+            total += tr
+            value = math.nan
+        elif self._count == self.period:
+            total += tr
+            value = total / self.period
+        else:
+            value = self._value * (self.period - 1)
+            value += tr
+            value /= self.period
+
+        if final:
+            self._prev_close = close
+            self._total = total
+            if not math.isnan(value):
+                self._value = value
+            self._count += 1
+        return value
+
+class BollingerBands(_RollingWindow):
+    """Streaming Bollinger bands, like talib.BBANDS with an SMA middle band. Returns (upper, middle, lower)."""
+    __slots__ = ("period", "nbdevup", "nbdevdn", "_ring", "_pos", "_sum", "_sumsq")
+    _params = ("period", "nbdevup", "nbdevdn")
+    _state = _RollingWindow._window_state
+
+    def __init__(self, period=5, nbdevup=2.0, nbdevdn=2.0):
+        self.period = period
+        self.nbdevup = nbdevup
+        self.nbdevdn = nbdevdn
+        self._init_window()
+
+    def update(self, high, low, close, final=True):
+        count, total, total_sq = self._peek_window(close, self.period)
+        if final:
+            self._push_window(close, self.period, total, total_sq)
+        if count < self.period:
+            return math.nan, math.nan, math.nan
+
+        mean = total / self.period
+        var = total_sq / self.period - mean * mean
+        std = math.sqrt(var) if var >= _ZERO else 0.0
+        return mean + std * self.nbdevup, mean, mean - std * self.nbdevdn
+
+class MACD(Indicator):
+    """Streaming MACD, seeded like talib.MACD. Returns (macd, signal, hist)."""
+    __slots__ = ("fast", "slow", "signal", "_kf", "_ks", "_kg", "_count", "_closes",
+                 "_fast_value", "_slow_value", "_signal_count", "_signal_total", "_signal_value")
+    _params = ("fast", "slow", "signal")
+    _state = ("_count", "_closes", "_fast_value", "_slow_value",
+              "_signal_count", "_signal_total", "_signal_value")
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._kf = 2.0 / (fast + 1)
+        self._ks = 2.0 / (slow + 1)
+        self._kg = 2.0 / (signal + 1)
+        self._count = 0
+        # Closes kept only until both EMAs are seeded, then released
+        self._closes = []
+        self._fast_value = 0.0
+        self._slow_value = 0.0
+        self._signal_count = 0
+        self._signal_total = 0.0
+        self._signal_value = 0.0
+
+    def update(self, high, low, close, final=True):
+        nan3 = (math.nan, math.nan, math.nan)
+
+        if self._count < self.slow:
+            closes = self._closes + [close]
+            if final:
+                self._closes = closes
+                self._count += 1
+            if len(closes) < self.slow:
+                return nan3
+            # Both EMAs are seeded on this bar: slow over `slow` closes, fast over the last `fast`
+            slow_value = sum(closes) / self.slow
+            fast_value = sum(closes[-self.fast:]) / self.fast
+            if final:
+                self._closes = []
+        else:
+            fast_value = ((close - self._fast_value) * self._kf) + self._fast_value
+            slow_value = ((close - self._slow_value) * self._ks) + self._slow_value
+
+        line = fast_value - slow_value
+        if self._signal_count < self.signal:
+            signal_total = self._signal_total + line
+            signal_value = signal_total / self.signal if self._signal_count + 1 == self.signal else math.nan
+        else:
+            signal_total = self._signal_total
+            signal_value = ((line - self._signal_value) * self._kg) + self._signal_value
+
+        if final:
+            self._fast_value, self._slow_value = fast_value, slow_value
+            self._signal_total = signal_total
+            if not math.isnan(signal_value):
+                self._signal_value = signal_value
+            self._signal_count += 1
+
+        if math.isnan(signal_value):
+            return nan3
+        return line, signal_value, line - signal_value
+
+class Volatility(_RollingWindow):
+    """Streaming rolling volatility of log returns, like `volatility`."""
+    __slots__ = ("period", "_prev_close", "_ring", "_pos", "_sum", "_sumsq")
+    _params = ("period",)
+    _state = ("_prev_close",) + _RollingWindow._window_state
+
+    def __init__(self, period=20):
+        self.period = period
+        self._prev_close = None
+        self._init_window()
+
+    def update(self, high, low, close, final=True):
+        if self._prev_close is None:
+            if final:
+                self._prev_close = close
+            return math.nan
+
+        ret = math.log(close / self._prev_close)
+        count, total, total_sq = self._peek_window(ret, self.period)
+        if final:
+            self._prev_close = close
+            self._push_window(ret, self.period, total, total_sq)
+        if count < self.period:
+            return math.nan
+
+        var = (total_sq - total * total / self.period) / (self.period - 1)
+        return math.sqrt(max(var, 0.0))
+
+INDICATOR_TYPES = {cls.__name__: cls for cls in (EMA, RSI, ATR, BollingerBands, MACD, Volatility)}
+
+# Indicator set tracked per series by default: name -> (class, params)
+DEFAULT_INDICATORS = {
+    "ema_20": (EMA, {"period": 20}),
+    "ema_50": (EMA, {"period": 50}),
+    "rsi_14": (RSI, {"period": 14}),
+    "atr_14": (ATR, {"period": 14}),
+    "bbands_20": (BollingerBands, {"period": 20}),
+    "macd": (MACD, {}),
+    "volatility_20": (Volatility, {"period": 20})
+}
+
+def indicator_from_state(state):
+    """
+    Restores a streaming indicator from `Indicator.state()` output.
+    """
+    return INDICATOR_TYPES[state["type"]].from_state(state)
+
+# Bybit kline intervals that are not a number of minutes. A month is taken as
+# its longest length, so a gap check never mistakes a short month for a gap.
+_INTERVAL_MS = {"D": 86400000, "W": 7 * 86400000, "M": 31 * 86400000}
+
+def _interval_ms(interval):
+    """
+    Returns the length of a Bybit kline interval in milliseconds, or None if unknown.
+    """
+    interval = str(interval)
+    if interval.isdigit():
+        return int(interval) * 60000
+    return _INTERVAL_MS.get(interval)
+
+def _valid_price(*prices):
+    return all(math.isfinite(p) and p > 0 for p in prices)
+
+class _Series:
+    """Indicators and candle bookkeeping for one (symbol, interval) series."""
+    __slots__ = ("indicators", "last_start", "pending", "latest")
+
+    def __init__(self, indicators):
+        self.indicators = indicators
+        self.last_start = None  # start time of the last committed candle
+        self.pending = None     # (start, high, low, close) of the in-progress candle
+        self.latest = {}
+
+class IndicatorBank:
+    """
+    Streaming indicators for many (symbol, interval) series in one process.
+
+    Each series holds one instance of every indicator in `specs`, created on
+    its first candle. Candles are identified by their start time: repeated
+    in-progress updates for the same candle are evaluated without committing,
+    a closed candle commits, and a candle that was never seen closed is
+    committed when the next one starts.
+    """
+
+    def __init__(self, specs=None):
+        self.specs = dict(specs or DEFAULT_INDICATORS)
+        self._series = {}
+
+    def _get_series(self, symbol, interval):
+        key = (symbol, str(interval))
+        series = self._series.get(key)
+        if series is None:
+            series = _Series({name: cls(**params) for name, (cls, params) in self.specs.items()})
+            self._series[key] = series
+        return series
+
+    def update(self, symbol, interval, start, high, low, close, final=True):
+        """
+        Feeds one candle to every indicator of a series.
+
+        Args:
+            symbol (str): Trading pair.
+            interval (str): Timeframe interval.
+            start (int): Candle start time in milliseconds.
+            high (float): High price.
+            low (float): Low price.
+            close (float): Close (or last) price.
+            final (bool): Whether the candle is closed.
+
+        Returns:
+            dict: Indicator values by name, or None if the candle was already committed.
+        """
+        # Reject bad ticks before any indicator commits, so one failing
+        # indicator cannot leave the series partially updated
+        if not _valid_price(high, low, close):
+            logging.warning(f"⚠️ Skipping invalid candle for {symbol} ({interval}m) at {start}: "
+                            f"high={high}, low={low}, close={close}")
+            return None
+
+        series = self._get_series(symbol, interval)
+        if series.last_start is not None and start <= series.last_start:
+            return None
+
+        if series.pending is not None and series.pending[0] < start:
+            _, p_high, p_low, p_close = series.pending
+            for indicator in series.indicators.values():
+                indicator.update(p_high, p_low, p_close, final=True)
+            series.last_start = series.pending[0]
+
+        series.latest = {
+            name: indicator.update(high, low, close, final)
+            for name, indicator in series.indicators.items()
+        }
+        if final:
+            series.last_start = start
+            series.pending = None
+        else:
+            series.pending = (start, high, low, close)
+        return series.latest
+
+    def update_from_kline(self, message):
+        """
+        Feeds a Bybit 'kline.{interval}.{symbol}' WebSocket message.
+
+        Args:
+            message (dict): Decoded WebSocket message.
+
+        Returns:
+            dict: Indicator values after the last candle in the message, or None.
+        """
+        _, interval, symbol = message["topic"].split(".", 2)
+        values = None
+        for candle in message.get("data", []):
+            result = self.update(
+                symbol, interval, int(candle["start"]),
+                float(candle["high"]), float(candle["low"]), float(candle["close"]),
+                final=bool(candle.get("confirm", False))
+            )
+            if result is not None:
+                values = result
+        return values
+
+    def warm_up(self, df, symbol="BTCUSDT", interval="1"):
+        """
+        Commits historical candles (e.g. from fetch_ohlcv or fetch_candles) to a series.
+
+        Candles the series has already committed are skipped, so a bank
+        restored from saved state only catches up on what it missed. If the
+        oldest candle in `df` starts later than the candle after the last
+        committed one, the gap cannot be filled and the series is rebuilt
+        from `df` alone.
+
+        Args:
+            df (pd.DataFrame): Closed candles with 'timestamp', 'high', 'low', 'close' columns.
+            symbol (str): Trading pair.
+            interval (str): Timeframe interval.
+        """
+        if df.empty:
+            return
+        df = df.sort_values("timestamp")
+        starts = (pd.to_datetime(df["timestamp"]) - pd.Timestamp(0)) // pd.Timedelta(milliseconds=1)
+
+        step = _interval_ms(interval)
+        if step is None and len(starts) > 1:
+            step = int(starts.diff().min())
+
+        key = (symbol, str(interval))
+        series = self._series.get(key)
+        if (series is not None and series.last_start is not None and step is not None
+                and starts.iloc[0] > series.last_start + step):
+            logging.warning(f"⚠️ Indicator state for {symbol} ({interval}m) is too old to resume; rebuilding.")
+            del self._series[key]
+
+        for start, high, low, close in zip(starts.tolist(), df["high"].tolist(),
+                                           df["low"].tolist(), df["close"].tolist()):
+            self.update(symbol, interval, start, float(high), float(low), float(close), final=True)
+
+    def latest(self, symbol, interval):
+        """
+        Returns the most recent indicator values for a series, or an empty dict.
+        """
+        series = self._series.get((symbol, str(interval)))
+        return dict(series.latest) if series else {}
+
+    def state(self):
+        """
+        Returns a JSON-serialisable snapshot of every series.
+        """
+        return {
+            "specs": {name: [cls.__name__, params] for name, (cls, params) in self.specs.items()},
+            "series": [
+                {
+                    "symbol": symbol,
+                    "interval": interval,
+                    "last_start": series.last_start,
+                    "pending": list(series.pending) if series.pending else None,
+                    "latest": series.latest,
+                    "indicators": {name: ind.state() for name, ind in series.indicators.items()}
+                }
+                for (symbol, interval), series in self._series.items()
+            ]
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Rebuilds a bank from `state()` output without replaying history.
+        """
+        bank = cls({name: (INDICATOR_TYPES[type_name], params)
+                    for name, (type_name, params) in state["specs"].items()})
+        for item in state["series"]:
+            series = _Series({name: indicator_from_state(s) for name, s in item["indicators"].items()})
+            series.last_start = item["last_start"]
+            series.pending = tuple(item["pending"]) if item["pending"] else None
+            series.latest = {name: tuple(v) if isinstance(v, list) else v
+                             for name, v in item.get("latest", {}).items()}
+            bank._series[(item["symbol"], item["interval"])] = series
+        return bank
+
+def save_indicator_state(bank, path):
+    """
+    Writes an IndicatorBank snapshot to a JSON file.
+
+    Args:
+        bank (IndicatorBank): Bank to save.
+        path (str): Destination file path.
+    """
+    try:
+        # Write then rename so a crash mid-write never leaves a truncated file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(bank.state(), f)
+        os.replace(tmp_path, path)
+        logging.info(f"✅ Saved indicator state to {path}")
+    except Exception as e:
+        logging.error(f"❌ Failed to save indicator state: {e}")
+
+def load_indicator_state(path):
+    """
+    Loads an IndicatorBank snapshot written by save_indicator_state.
+
+    Args:
+        path (str): Source file path.
+
+    Returns:
+        IndicatorBank: Restored bank, or None if the file cannot be read.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            bank = IndicatorBank.from_state(json.load(f))
+        logging.info(f"✅ Loaded indicator state from {path}")
+        return bank
+    except Exception as e:
+        logging.error(f"❌ Failed to load indicator state: {e}")
+        return None
+
+if __name__ == "__main__":
+    # Example usage with dummy data
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-01", periods=len(close), freq="min"),
+        "high": close + 0.5,
+        "low": close - 0.5,
+        "close": close
+    })
+
+    indicators = compute_indicators(df)
+    for name, series in indicators.items():
+        print(f"{name}: {series.iloc[-1]:.4f}")
+
+    bank = IndicatorBank()
+    bank.warm_up(df, "BTCUSDT", "1")
+    print("Streaming:", bank.latest("BTCUSDT", "1"))
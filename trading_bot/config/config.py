@@ -21,6 +21,9 @@ if not BYBIT_API_KEY or not BYBIT_SECRET_KEY:
 MONGO_URI = os.getenv("MONGO_URI")
 DB_NAME = os.getenv("DB_NAME")
 
+# Streaming indicator state, saved so a restart resumes without a full warm-up
+INDICATOR_STATE_PATH = os.getenv("INDICATOR_STATE_PATH", os.path.join(BASE_DIR, "indicator_state.json"))
+
 # Bybit API Endpoints
 BYBIT_MAINNET_URL = "https://api.bybit.com"
 BYBIT_TESTNET_URL = "https://api-testnet.bybit.com"
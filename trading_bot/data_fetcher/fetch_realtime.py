@@ -1,10 +1,14 @@
 import websocket
 import json
+import os
+import atexit
 import threading
 import time
 import logging
 import ssl
-from trading_bot.config.config import USE_TESTNET
+from trading_bot.config.config import USE_TESTNET, INDICATOR_STATE_PATH
+from trading_bot.analysis.indicators import IndicatorBank, load_indicator_state, save_indicator_state
+from trading_bot.data_fetcher.fetch_ohlcv import fetch_ohlcv
 
 # Select the correct WebSocket URL based on environment
 BYBIT_WS_URL = (
@@ -13,6 +17,15 @@ BYBIT_WS_URL = (
     else "wss://stream.bybit.com/v5/public/linear"
 )
 
+# Streaming indicators for every subscribed kline series
+indicator_bank = IndicatorBank()
+indicator_lock = threading.Lock()
+
+# Minimum seconds between indicator state saves
+STATE_SAVE_INTERVAL = 60
+_last_state_save = 0.0
+_save_on_exit_registered = False
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -21,9 +34,58 @@ def on_message(ws, message):
     try:
         data = json.loads(message)
         logging.info(f"📡 Received: {data}")
+        if data.get("topic", "").startswith("kline."):
+            with indicator_lock:
+                values = indicator_bank.update_from_kline(data)
+            if values:
+                logging.info(f"📈 Indicators ({data['topic']}): {values}")
+            save_indicators()
     except Exception as e:
         logging.error(f"❌ Error processing message: {e}")
 
+def init_indicators(symbol="BTCUSDT", interval="1", df=None):
+    """
+    Restores saved indicator state and catches up on candles missed while offline.
+
+    Call before starting the WebSocket. State is saved periodically while
+    streaming and again when the process exits.
+
+    Args:
+        symbol (str): Trading pair.
+        interval (str): Timeframe interval.
+        df (pd.DataFrame): Recent candles from fetch_ohlcv, fetched if not given.
+    """
+    global indicator_bank, _save_on_exit_registered
+    if os.path.exists(INDICATOR_STATE_PATH):
+        bank = load_indicator_state(INDICATOR_STATE_PATH)
+        if bank is not None:
+            indicator_bank = bank
+
+    if df is None:
+        df = fetch_ohlcv(symbol, interval, 200)
+    if df is not None and not df.empty:
+        # Bybit includes the current, still-open candle; leave that one to the stream
+        df = df.sort_values("timestamp").iloc[:-1]
+        indicator_bank.warm_up(df, symbol, interval)
+        logging.info(f"📈 Indicators warmed up ({symbol} {interval}m): {indicator_bank.latest(symbol, interval)}")
+    else:
+        logging.warning("⚠️ No OHLCV data for indicator warm-up; indicators will warm up from the stream.")
+
+    save_indicators(force=True)
+    if not _save_on_exit_registered:
+        atexit.register(save_indicators, force=True)
+        _save_on_exit_registered = True
+
+def save_indicators(force=False):
+    """Saves indicator state, at most once per STATE_SAVE_INTERVAL unless forced."""
+    global _last_state_save
+    now = time.time()
+    if not force and now - _last_state_save < STATE_SAVE_INTERVAL:
+        return
+    with indicator_lock:
+        save_indicator_state(indicator_bank, INDICATOR_STATE_PATH)
+    _last_state_save = now
+
 def on_error(ws, error):
     """Handle WebSocket errors."""
     logging.error(f"❌ WebSocket Error: {error}")
@@ -67,6 +129,8 @@ def start_websocket():
         start_websocket()
 
 if __name__ == "__main__":
+    init_indicators()
+
     # Run WebSocket in a daemon thread
     ws_thread = threading.Thread(target=start_websocket, daemon=True)
     ws_thread.start()
@@ -0,0 +1,383 @@
+import numpy as np
+import pandas as pd
+import logging
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from datetime import datetime, timezone
+from trading_bot.database.mongodb_setup import (
+    get_database, is_timeseries_collection, OHLCV_COLLECTION, ORDERBOOK_COLLECTION,
+    OHLCV_FIELDS
+)
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Documents per cursor batch. The server caps every reply at 16 MB whatever
+# the batch size, so each default is sized to what its cursor returns:
+# candle chunks are ~1 MB each (see CANDLE_CHUNK_MS), while a 50-level order
+# book snapshot with float levels is ~3 KB.
+CANDLE_CHUNK_BATCH_SIZE = 12
+ORDERBOOK_BATCH_SIZE = 2000
+
+# Time span of one columnar chunk returned by the candle pipeline. A week of
+# 1-minute candles is ~10k rows, about 1 MB of BSON, well below the 16 MB
+# document limit.
+CANDLE_CHUNK_MS = 7 * 24 * 60 * 60 * 1000
+
+def _to_ms(value):
+    """
+    Converts a timestamp given as int/float milliseconds, datetime or pandas Timestamp to int milliseconds.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return int(value)
+    return int(pd.Timestamp(value).timestamp() * 1000)
+
+def _ms_to_datetime(ms):
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+def _range_filter(start_ms, end_ms, as_datetime=False):
+    """
+    Builds a {$gte, $lt} range condition, or None if no bound is given.
+    """
+    condition = {}
+    if start_ms is not None:
+        condition["$gte"] = _ms_to_datetime(start_ms) if as_datetime else start_ms
+    if end_ms is not None:
+        condition["$lt"] = _ms_to_datetime(end_ms) if as_datetime else end_ms
+    return condition or None
+
+def _candle_pipeline(symbol, interval, start_ms, end_ms, downsample, timeseries):
+    """
+    Builds the aggregation pipeline for a candle range query.
+
+    Candles are grouped on the server into chunks covering CANDLE_CHUNK_MS,
+    each returned as one document of per-field arrays:
+    {'_id': chunk_start, 'timestamp': [...], 'open': [...], ...}. The client
+    then reads a handful of flat arrays straight into numpy instead of
+    decoding one document per candle.
+    """
+    if timeseries:
+        match = {"meta.symbol": symbol, "meta.interval": interval}
+        time_field = "time"
+        time_range = _range_filter(start_ms, end_ms, as_datetime=True)
+    else:
+        match = {"symbol": symbol, "interval": interval}
+        time_field = "timestamp"
+        time_range = _range_filter(start_ms, end_ms)
+    if time_range:
+        match[time_field] = time_range
+
+    pipeline = [
+        {"$match": match},
+        {"$sort": {time_field: 1}}
+    ]
+
+    if downsample:
+        # Aggregate candles into buckets of `downsample` minutes on the server
+        bucket_ms = int(downsample) * 60 * 1000
+        pipeline += [
+            {"$group": {
+                "_id": {"$subtract": ["$timestamp", {"$mod": ["$timestamp", bucket_ms]}]},
+                "open": {"$first": "$open"},
+                "high": {"$max": "$high"},
+                "low": {"$min": "$low"},
+                "close": {"$last": "$close"},
+                "volume": {"$sum": "$volume"}
+            }},
+            {"$sort": {"_id": 1}},
+            {"$project": {"_id": 0, "timestamp": "$_id", "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1}}
+        ]
+
+    # $push keeps the sorted input order within each chunk
+    chunk = {field: {"$push": f"${field}"} for field in OHLCV_FIELDS}
+    chunk["_id"] = {"$subtract": ["$timestamp", {"$mod": ["$timestamp", CANDLE_CHUNK_MS]}]}
+    pipeline += [
+        {"$group": chunk},
+        {"$sort": {"_id": 1}}
+    ]
+    return pipeline
+
+# BSON element types handled by the columnar decoder
+_BSON_DOUBLE = 0x01
+_BSON_ARRAY = 0x04
+_BSON_INT64 = 0x12
+_BSON_DTYPES = {_BSON_DOUBLE: "<f8", _BSON_INT64: "<i8"}
+
+def _bson_array_length(payload):
+    """
+    Returns the element count of a BSON array of 8-byte values whose elements take `payload` bytes.
+
+    Each element is a type byte, its index as a NUL-terminated decimal key
+    and 8 value bytes. Returns None if no element count fits exactly.
+    """
+    count, digits, group = 0, 1, 10
+    while payload > 0:
+        size = 10 + digits
+        if payload <= group * size:
+            return count + payload // size if payload % size == 0 else None
+        payload -= group * size
+        count += group
+        digits, group = digits + 1, group * 9 if digits == 1 else group * 10
+    return count
+
+def _decode_bson_array(buf, start, dtype):
+    """
+    Decodes the BSON array at `start` in `buf` straight into a numpy array.
+
+    Returns None unless every element is an 8-byte value of the type matching `dtype`.
+    """
+    size = int.from_bytes(buf[start:start + 4].tobytes(), "little")
+    n = _bson_array_length(size - 5)
+    if n is None:
+        return None
+
+    digits = np.ones(n, dtype=np.int64)
+    power = 10
+    while power < n:
+        digits[power:] += 1
+        power *= 10
+    element_starts = start + 4 + np.concatenate(([0], np.cumsum(10 + digits)[:-1]))
+
+    expected = _BSON_INT64 if dtype == np.int64 else _BSON_DOUBLE
+    if n and not (buf[element_starts] == expected).all():
+        return None
+    value_starts = element_starts + digits + 2
+    raw = buf[value_starts[:, None] + np.arange(8)]
+    return raw.view(_BSON_DTYPES[expected]).ravel().astype(dtype, copy=False)
+
+def _raw_chunk_to_arrays(chunk):
+    """
+    Decodes one raw chunk document into {field: np.ndarray}, or None if its layout is unexpected.
+    """
+    raw = bytes(chunk.raw)
+    buf = np.frombuffer(raw, dtype=np.uint8)
+    arrays = {}
+    pos = 4
+    while raw[pos] != 0:
+        element_type = raw[pos]
+        name_end = raw.index(b"\0", pos + 1)
+        name = raw[pos + 1:name_end].decode()
+        value = name_end + 1
+        if element_type == _BSON_ARRAY:
+            dtype = np.int64 if name == "timestamp" else np.float64
+            arrays[name] = _decode_bson_array(buf, value, dtype)
+            pos = value + int.from_bytes(raw[value:value + 4], "little")
+        elif element_type in _BSON_DTYPES:
+            pos = value + 8
+        else:
+            return None
+
+    if any(arrays.get(field) is None for field in OHLCV_FIELDS):
+        return None
+    return arrays
+
+def _chunks_to_columns(chunks):
+    """
+    Concatenates columnar chunk documents into one numpy array per candle field.
+
+    Raw chunks (RawBSONDocument) are decoded directly from their bytes;
+    chunks with any other value types fall back to the regular BSON decoder.
+    """
+    parts = {field: [] for field in OHLCV_FIELDS}
+    for chunk in chunks:
+        arrays = _raw_chunk_to_arrays(chunk) if isinstance(chunk, RawBSONDocument) else None
+        if arrays is None:
+            values = bson.decode(bytes(chunk.raw)) if isinstance(chunk, RawBSONDocument) else chunk
+            arrays = {
+                field: np.array(values[field], dtype=np.int64 if field == "timestamp" else np.float64)
+                for field in OHLCV_FIELDS
+            }
+        for field in OHLCV_FIELDS:
+            parts[field].append(arrays[field])
+
+    columns = {}
+    for field in OHLCV_FIELDS:
+        dtype = np.int64 if field == "timestamp" else np.float64
+        columns[field] = np.concatenate(parts[field]) if parts[field] else np.empty(0, dtype=dtype)
+    return columns
+
+def fetch_candles(symbol="BTCUSDT", interval="1", start=None, end=None, downsample=None,
+                  as_frame=True, batch_size=CANDLE_CHUNK_BATCH_SIZE, db=None):
+    """
+    Loads stored OHLCV candles for a symbol and interval as columnar data.
+
+    On a regular collection the range is resolved through the covering
+    index created by `ensure_indexes`, projecting only candle fields, so
+    documents are never fetched. On a time-series collection the
+    meta.symbol / meta.interval / time index selects the buckets instead.
+    Candles are returned sorted by timestamp.
+
+    :param symbol: Trading pair (default: BTCUSDT)
+    :param interval: Timeframe interval as stored by save_ohlcv (e.g., '1')
+    :param start: Inclusive range start (ms, datetime or pandas Timestamp); None for no bound
+    :param end: Exclusive range end (ms, datetime or pandas Timestamp); None for no bound
+    :param downsample: Optional bucket size in minutes to aggregate candles into on the server
+    :param as_frame: Return a DataFrame (True) or a dict of numpy arrays (False)
+    :param batch_size: Number of chunk documents (about 1 MB each) per cursor batch; replies are capped at 16 MB
+    :param db: Optional database reference; a new connection is opened and closed if omitted
+    :return: DataFrame in the fetch_ohlcv layout, dict of numpy arrays, or None if an error occurs
+    """
+    client = None
+    if db is None:
+        db, client = get_database()
+        if db is None:
+            logging.error("❌ No database connection.")
+            return None
+
+    try:
+        timeseries = is_timeseries_collection(db, OHLCV_COLLECTION)
+        pipeline = _candle_pipeline(symbol, interval, _to_ms(start), _to_ms(end), downsample, timeseries)
+        collection = db.get_collection(OHLCV_COLLECTION, codec_options=CodecOptions(document_class=RawBSONDocument))
+        cursor = collection.aggregate(pipeline, allowDiskUse=True, batchSize=batch_size)
+        columns = _chunks_to_columns(cursor)
+    except Exception as e:
+        logging.error(f"❌ Failed to load OHLCV data: {e}")
+        return None
+    finally:
+        if client is not None:
+            client.close()
+
+    logging.info(f"✅ Loaded {len(columns['timestamp'])} OHLCV data points for {symbol} ({interval}m)")
+
+    if not as_frame:
+        return columns
+
+    df = pd.DataFrame(columns)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    return df
+
+def _levels_expression(field, depth):
+    """
+    Converts the stored [price, size] string pairs of one book side to doubles on the server.
+    """
+    levels = {"$slice": [f"${field}", depth]} if depth else f"${field}"
+    return {
+        "$map": {
+            "input": levels,
+            "as": "level",
+            "in": [
+                {"$toDouble": {"$arrayElemAt": ["$$level", 0]}},
+                {"$toDouble": {"$arrayElemAt": ["$$level", 1]}}
+            ]
+        }
+    }
+
+def _pack_levels(snapshots, depth):
+    """
+    Packs per-snapshot level lists into an (n, depth, 2) array, padding short books with NaN.
+    """
+    packed = np.full((len(snapshots), depth, 2), np.nan)
+    for i, levels in enumerate(snapshots):
+        if levels:
+            packed[i, :len(levels)] = levels
+    return packed
+
+def fetch_orderbooks(symbol="BTCUSDT", start=None, end=None, depth=None,
+                     as_frame=False, batch_size=ORDERBOOK_BATCH_SIZE, db=None):
+    """
+    Loads stored order book snapshots for a symbol as columnar data.
+
+    Levels are truncated to `depth` and converted to floats on the server.
+    The array layout is {'timestamp': (n,), 'bids': (n, depth, 2), 'asks': (n, depth, 2)}
+    with the last axis holding (price, size); books shallower than `depth`
+    are padded with NaN.
+
+    :param symbol: Trading pair (default: BTCUSDT)
+    :param start: Inclusive range start (ms, datetime or pandas Timestamp); None for no bound
+    :param end: Exclusive range end (ms, datetime or pandas Timestamp); None for no bound
+    :param depth: Number of levels per side to load; None loads every stored level
+    :param as_frame: Return a long DataFrame (timestamp, side, level, price, size) instead of arrays
+    :param batch_size: Number of snapshots per cursor batch; replies are capped at 16 MB
+    :param db: Optional database reference; a new connection is opened and closed if omitted
+    :return: Dict of numpy arrays, DataFrame, or None if an error occurs
+    """
+    client = None
+    if db is None:
+        db, client = get_database()
+        if db is None:
+            logging.error("❌ No database connection.")
+            return None
+
+    match = {"symbol": symbol}
+    time_range = _range_filter(_to_ms(start), _to_ms(end))
+    if time_range:
+        match["timestamp"] = time_range
+
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"timestamp": 1}},
+        {"$project": {
+            "_id": 0,
+            "t": "$timestamp",
+            "b": _levels_expression("bids", depth),
+            "a": _levels_expression("asks", depth)
+        }}
+    ]
+
+    try:
+        cursor = db[ORDERBOOK_COLLECTION].aggregate(pipeline, batchSize=batch_size)
+        docs = list(cursor)
+    except Exception as e:
+        logging.error(f"❌ Failed to load Order Book data: {e}")
+        return None
+    finally:
+        if client is not None:
+            client.close()
+
+    bids = [doc["b"] for doc in docs]
+    asks = [doc["a"] for doc in docs]
+    if depth is None:
+        depth = max((len(levels) for levels in bids + asks), default=0)
+
+    books = {
+        "timestamp": np.fromiter((doc["t"] for doc in docs), dtype=np.int64, count=len(docs)),
+        "bids": _pack_levels(bids, depth),
+        "asks": _pack_levels(asks, depth)
+    }
+
+    logging.info(f"✅ Loaded {len(docs)} Order Book snapshots for {symbol}")
+
+    if not as_frame:
+        return books
+
+    frames = []
+    for side in ("bids", "asks"):
+        levels = books[side]
+        n = len(levels)
+        frame = pd.DataFrame({
+            "timestamp": np.repeat(books["timestamp"], depth),
+            "side": side[:-1],
+            "level": np.tile(np.arange(depth), n),
+            "price": levels[:, :, 0].ravel(),
+            "size": levels[:, :, 1].ravel()
+        })
+        frames.append(frame.dropna(subset=["price"]))
+
+    df = pd.concat(frames, ignore_index=True)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    return df.sort_values(["timestamp", "side", "level"], ignore_index=True)
+
+# Example usage
+if __name__ == "__main__":
+    from trading_bot.database.mongodb_setup import ensure_indexes
+
+    db, client = get_database()
+    if db is not None:
+        ensure_indexes(db)
+
+        candles = fetch_candles("BTCUSDT", "1", db=db)
+        if candles is not None:
+            print(candles.tail())
+
+        hourly = fetch_candles("BTCUSDT", "1", downsample=60, db=db)
+        if hourly is not None:
+            print(hourly.tail())
+
+        books = fetch_orderbooks("BTCUSDT", depth=10, db=db)
+        if books is not None:
+            print("Snapshots:", len(books["timestamp"]), "Bids shape:", books["bids"].shape)
+
+        client.close()
@@ -1,4 +1,5 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING
+from datetime import datetime, timezone
 import logging
 from trading_bot.config.config import MONGO_URI, DB_NAME
 
@@ -8,6 +9,15 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # Collection names
 OHLCV_COLLECTION = "ohlcv"
 ORDERBOOK_COLLECTION = "orderbook"
+OHLCV_LEGACY_COLLECTION = "ohlcv_legacy"
+
+# Index names
+OHLCV_COVERING_INDEX = "ohlcv_covering"
+OHLCV_TIMESERIES_INDEX = "ohlcv_meta_time"
+ORDERBOOK_INDEX = "orderbook_symbol_ts"
+
+# Candle fields stored per document, in the order returned by queries
+OHLCV_FIELDS = ["timestamp", "open", "high", "low", "close", "volume"]
 
 def get_database():
     """
@@ -22,6 +32,139 @@ def get_database():
         logging.error(f"❌ Failed to connect to MongoDB: {e}")
         return None, None
 
+def is_timeseries_collection(db, name):
+    """
+    Checks whether a collection is a MongoDB time-series collection.
+
+    :param db: Database reference.
+    :param name: Collection name.
+    :return: True if the collection exists and is a time-series collection.
+    """
+    return bool(list(db.list_collection_names(filter={"name": name, "type": "timeseries"})))
+
+def ensure_indexes(db):
+    """
+    Creates the indexes used by the read-side queries in mongodb_query.
+
+    On a regular OHLCV collection the index holds every candle field, so
+    range queries projected onto those fields are answered from the index
+    alone without fetching documents. On a time-series collection the index
+    covers the meta.symbol / meta.interval / time filter instead.
+
+    :param db: Database reference.
+    """
+    try:
+        if is_timeseries_collection(db, OHLCV_COLLECTION):
+            db[OHLCV_COLLECTION].create_index(
+                [("meta.symbol", ASCENDING), ("meta.interval", ASCENDING), ("time", ASCENDING)],
+                name=OHLCV_TIMESERIES_INDEX
+            )
+        else:
+            db[OHLCV_COLLECTION].create_index(
+                [("symbol", ASCENDING), ("interval", ASCENDING)] + [(f, ASCENDING) for f in OHLCV_FIELDS],
+                name=OHLCV_COVERING_INDEX
+            )
+        db[ORDERBOOK_COLLECTION].create_index(
+            [("symbol", ASCENDING), ("timestamp", ASCENDING)],
+            name=ORDERBOOK_INDEX
+        )
+        logging.info("✅ MongoDB indexes are in place.")
+    except Exception as e:
+        logging.error(f"❌ Failed to create MongoDB indexes: {e}")
+
+def migrate_ohlcv_to_timeseries(granularity="minutes", batch_size=10000, drop_source=False):
+    """
+    Migrates the OHLCV collection to a MongoDB time-series collection.
+
+    The existing collection is renamed to 'ohlcv_legacy', a time-series
+    collection is created under the original name and every candle is copied
+    over in batches. Time-series collections cannot be renamed, so the
+    legacy collection is the one that moves. If the copy fails or the copied
+    count does not match, the new collection is dropped and 'ohlcv_legacy'
+    is renamed back to 'ohlcv', so the migration can simply be run again.
+    Writers should be stopped while it runs.
+
+    :param granularity: Time-series bucket granularity ('seconds', 'minutes' or 'hours').
+    :param batch_size: Number of candles inserted per batch.
+    :param drop_source: Whether to drop 'ohlcv_legacy' after a successful migration.
+    :return: Number of candles copied, or None if the migration failed.
+    """
+    db, client = get_database()
+    if db is None:
+        logging.error("❌ No database connection.")
+        return None
+
+    copied = None
+    renamed = False
+    created = False
+    try:
+        if is_timeseries_collection(db, OHLCV_COLLECTION):
+            logging.info("ℹ️ OHLCV collection is already a time-series collection.")
+            return 0
+        if OHLCV_LEGACY_COLLECTION in db.list_collection_names():
+            logging.error(f"❌ '{OHLCV_LEGACY_COLLECTION}' already exists; drop or rename it before migrating.")
+            return None
+
+        if OHLCV_COLLECTION in db.list_collection_names():
+            db[OHLCV_COLLECTION].rename(OHLCV_LEGACY_COLLECTION)
+            renamed = True
+
+        db.create_collection(
+            OHLCV_COLLECTION,
+            timeseries={"timeField": "time", "metaField": "meta", "granularity": granularity}
+        )
+        created = True
+
+        copied = 0
+        if renamed:
+            batch = []
+            cursor = db[OHLCV_LEGACY_COLLECTION].find({}, {"_id": 0}).batch_size(batch_size)
+            for doc in cursor:
+                batch.append(_to_timeseries_record(doc))
+                if len(batch) >= batch_size:
+                    db[OHLCV_COLLECTION].insert_many(batch, ordered=False)
+                    copied += len(batch)
+                    batch = []
+            if batch:
+                db[OHLCV_COLLECTION].insert_many(batch, ordered=False)
+                copied += len(batch)
+
+            source_count = db[OHLCV_LEGACY_COLLECTION].count_documents({})
+            if copied != source_count:
+                raise RuntimeError(f"copied {copied} of {source_count} candles")
+
+        logging.info(f"✅ Migrated {copied} OHLCV data points to a time-series collection")
+
+        ensure_indexes(db)
+        if drop_source and renamed:
+            db[OHLCV_LEGACY_COLLECTION].drop()
+    except Exception as e:
+        logging.error(f"❌ Failed to migrate OHLCV data: {e}")
+        copied = None
+        try:
+            if created:
+                db.drop_collection(OHLCV_COLLECTION)
+            if renamed:
+                db[OHLCV_LEGACY_COLLECTION].rename(OHLCV_COLLECTION)
+        except Exception as restore_error:
+            logging.error(f"❌ Failed to restore the OHLCV collection: {restore_error}")
+    finally:
+        client.close()
+
+    return copied
+
+def _to_timeseries_record(record):
+    """
+    Converts a flat OHLCV record into the time-series collection layout.
+
+    Symbol and interval move into 'meta' so they are stored once per bucket
+    rather than once per candle.
+    """
+    record = dict(record)
+    record["time"] = datetime.fromtimestamp(record["timestamp"] / 1000, tz=timezone.utc)
+    record["meta"] = {"symbol": record.pop("symbol"), "interval": record.pop("interval")}
+    return record
+
 def save_ohlcv(data, symbol="BTCUSDT", interval="1"):
     """
     Saves OHLCV data to MongoDB.
@@ -59,7 +202,21 @@ def save_ohlcv(data, symbol="BTCUSDT", interval="1"):
         }
         formatted_data.append(record)
 
-    if formatted_data:
+    if formatted_data and is_timeseries_collection(db, OHLCV_COLLECTION):
+        try:
+            # Time-series collections do not support upserts, so replace stored copies of
+            # these candles (e.g. an earlier snapshot of the still-open candle) instead
+            collection.delete_many({
+                "meta.symbol": symbol,
+                "meta.interval": interval,
+                "time": {"$in": [datetime.fromtimestamp(r["timestamp"] / 1000, tz=timezone.utc) for r in formatted_data]}
+            })
+            new_records = [_to_timeseries_record(r) for r in formatted_data]
+            collection.insert_many(new_records, ordered=False)
+            logging.info(f"✅ Inserted {len(new_records)} OHLCV data points for {symbol} ({interval}m)")
+        except Exception as e:
+            logging.error(f"❌ Failed to insert OHLCV data: {e}")
+    elif formatted_data:
         try:
             # Insert records with upsert to avoid duplicates
             for record in formatted_data: